@@ -64,7 +64,21 @@ USE_AWS_BEDROCK = os.getenv("USE_AWS_BEDROCK", "false").lower() == "true"
 
 # Transformer Model Configuration (free alternative)
 USE_TRANSFORMER = os.getenv("USE_TRANSFORMER", "true").lower() == "true"
-TRANSFORMER_MODEL = os.getenv("TRANSFORMER_MODEL", "facebook/bart-large-cnn")
+TRANSFORMER_MODEL = os.getenv("TRANSFORMER_MODEL", "sshleifer/distilbart-cnn-12-6")
+
+# BART inference tuning
+BART_QUANT = os.getenv("BART_QUANT", "auto").lower()  # auto (int8 on CPU), none, int8
+BART_HEADLINE_MODEL = os.getenv("BART_HEADLINE_MODEL", "")  # e.g. facebook/bart-large-cnn, empty disables
+BART_HEADLINE_SCORE = int(os.getenv("BART_HEADLINE_SCORE", "80"))  # popularity above which the headline model is used
+BART_BACKEND = os.getenv("BART_BACKEND", "torch").lower()  # torch, onnx, openvino (CPU only, via optimum)
+BART_ONNX_DIR = os.getenv("BART_ONNX_DIR", ".cache/bart-onnx")  # exported ONNX graphs, reused across runs
+BART_OPENVINO_DIR = os.getenv("BART_OPENVINO_DIR", ".cache/bart-openvino")  # exported OpenVINO IR
+BART_COMPILE = os.getenv("BART_COMPILE", "false").lower() == "true"  # opt-in torch.compile + CUDA graphs, CUDA only
+BART_SERVER_URL = os.getenv("BART_SERVER_URL", "")  # e.g. http://localhost:8765, empty runs BART in-process
+BART_SERVER_HOST = os.getenv("BART_SERVER_HOST", "127.0.0.1")
+BART_SERVER_PORT = int(os.getenv("BART_SERVER_PORT", "8765"))
+BART_BATCH_SIZE = int(os.getenv("BART_BATCH_SIZE", "8"))  # articles per generate call
+BATCH_PACING_SEC = float(os.getenv("BATCH_PACING_SEC", "0"))  # pause after each generate batch
 
 # === ENHANCED AI CONTENT FILTERING ===
 AI_KEYWORDS = [
@@ -125,9 +139,12 @@ CATEGORIES = {
 MAX_ARTICLES = 12  # Increased for better curation
 MAX_ARTICLES_PER_CATEGORY = 3
 ARTICLES_PER_FEED = 10  # Increased to get more options
-DELAY_BETWEEN_REQUESTS = 1  # Reduced for faster processing
+DELAY_BETWEEN_REQUESTS = 1  # Minimum spacing between requests to the same host
+FETCH_MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", "16"))  # Concurrent article downloads
 DELAY_BETWEEN_SUMMARIES = 2  # Reduced for faster processing
 MIN_ARTICLE_LENGTH = 200  # Minimum article length in characters
+MAX_ARTICLE_BYTES = 2_000_000  # Stop downloading article pages after this many bytes
+TITLE_PREFILTER_CATEGORIES = ['misc']  # General-interest feeds: titles must mention AI before a download
 MAX_ARTICLE_AGE_HOURS = 48  # Only include articles from last 48 hours
 
 # === EMAIL CONFIGURATION ===
@@ -139,6 +156,8 @@ EMAIL_CONFIG = {
     'smtp_user': os.getenv("EMAIL_USER"),
     'smtp_password': os.getenv("EMAIL_PASSWORD")
 }
+EMAIL_MAX_WORKERS = int(os.getenv("EMAIL_MAX_WORKERS", "4"))  # Parallel SMTP sessions for multi-recipient sends
+EMAIL_MINIFY_HTML = os.getenv("EMAIL_MINIFY_HTML", "true").lower() == "true"  # Collapse template whitespace before sending
 
 # === OUTPUT PATHS ===
 OUTPUT_DIR = "output"
@@ -146,6 +165,10 @@ NEWSLETTER_MD = f"{OUTPUT_DIR}/newsletter.md"
 NEWSLETTER_HTML = f"{OUTPUT_DIR}/newsletter.html"
 NEWSLETTER_STYLED = f"{OUTPUT_DIR}/newsletter_styled.html"
 
+# === CACHE ===
+CACHE_ENABLED = os.getenv("NEWSLETTER_CACHE", "true").lower() == "true"
+CACHE_DIR = os.getenv("NEWSLETTER_CACHE_DIR", ".newsletter_cache")
+
 # === TEMPLATES ===
 TEMPLATE_DIR = "templates"
 NEWSLETTER_TEMPLATE = f"{TEMPLATE_DIR}/newsletter_template.html"
@@ -0,0 +1,110 @@
+"""
+Resident BART summarization server
+Keeps models loaded between newsletter runs and coalesces concurrent requests into batched generate calls
+Run with: python -m utils.bart_server  (clients opt in via BART_SERVER_URL)
+"""
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import List, Optional
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+import uvicorn
+from config import TRANSFORMER_MODEL, BART_HEADLINE_MODEL, BART_SERVER_HOST, BART_SERVER_PORT
+from .bart_summarizer import get_bart_summarizer
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# How long the batcher waits for more requests after the first one arrives
+COALESCE_WINDOW_SEC = 0.01
+
+# Only the configured models may be loaded; clients can't pull arbitrary hub models
+ALLOWED_MODELS = frozenset(name for name in (TRANSFORMER_MODEL, BART_HEADLINE_MODEL) if name)
+
+
+class SummarizeRequest(BaseModel):
+    texts: List[str]
+    max_length: int = 200
+    min_length: int = 50
+    num_beams: int = 1
+    model_name: str = TRANSFORMER_MODEL
+
+
+class SummarizeResponse(BaseModel):
+    summaries: List[Optional[str]]
+
+
+async def _batch_worker(queue: asyncio.Queue):
+    """Drain the queue in small time windows and run one generate per decoding setting"""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + COALESCE_WINDOW_SEC
+        while (timeout := deadline - loop.time()) > 0:
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # Only requests with identical settings can share a generate call
+        groups = {}
+        for request, future in batch:
+            settings = (request.model_name, request.max_length, request.min_length, request.num_beams)
+            groups.setdefault(settings, []).append((request, future))
+
+        for (model_name, max_length, min_length, num_beams), items in groups.items():
+            texts = [text for request, _ in items for text in request.texts]
+            try:
+                summarizer = get_bart_summarizer(model_name)
+                summarizer.server_url = None
+                summaries = await asyncio.to_thread(
+                    summarizer.summarize_texts, texts, max_length, min_length, num_beams
+                )
+            except Exception as e:
+                logger.error(f"❌ Batched summarization failed: {e}")
+                for _, future in items:
+                    # A client that disconnected leaves a cancelled future behind
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for request, future in items:
+                if not future.done():
+                    future.set_result(summaries[offset:offset + len(request.texts)])
+                offset += len(request.texts)
+            logger.info(f"📦 Served {len(items)} requests ({len(texts)} texts) in one batch")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the default model and start the batcher before accepting requests"""
+    summarizer = get_bart_summarizer()
+    # The server itself always runs the model locally
+    summarizer.server_url = None
+    await asyncio.to_thread(summarizer.load_model)
+
+    app.state.queue = asyncio.Queue()
+    worker = asyncio.create_task(_batch_worker(app.state.queue))
+    logger.info("🚀 BART server ready")
+    yield
+    worker.cancel()
+
+
+app = FastAPI(title="AI Newsletter BART server", lifespan=lifespan)
+
+
+@app.post("/summarize", response_model=SummarizeResponse)
+async def summarize(request: SummarizeRequest):
+    """Summarize texts, sharing a generate call with any concurrent requests"""
+    if request.model_name not in ALLOWED_MODELS:
+        raise HTTPException(status_code=400, detail=f"Model not served: {request.model_name}")
+    future = asyncio.get_running_loop().create_future()
+    await app.state.queue.put((request, future))
+    return SummarizeResponse(summaries=await future)
+
+
+if __name__ == "__main__":
+    uvicorn.run(app, host=BART_SERVER_HOST, port=BART_SERVER_PORT)
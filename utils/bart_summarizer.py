@@ -1,20 +1,160 @@
 """
 BART-CNN based summarization utilities for GitHub Actions
-Uses facebook/bart-large-cnn for high-quality, free AI newsletter generation
+Uses distilled BART-CNN (optionally bart-large-cnn for headlines) for free AI newsletter generation
 Optimized specifically for news summarization
 """
+import functools
+import importlib.util
 import logging
+import os
+import queue
+import re
+import threading
+from collections import Counter
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
+import requests
 import torch
-from transformers import BartForConditionalGeneration, BartTokenizer
-from config import CATEGORIES
+from transformers import BartForConditionalGeneration, BartTokenizerFast, TextIteratorStreamer
+from .cache import cache_key, cache_get, cache_set
+from config import (
+    CATEGORIES, TRANSFORMER_MODEL, BART_QUANT, BART_HEADLINE_MODEL, BART_HEADLINE_SCORE,
+    BART_BACKEND, BART_ONNX_DIR, BART_OPENVINO_DIR, BART_COMPILE, BART_SERVER_URL, BART_BATCH_SIZE, BATCH_PACING_SEC
+)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 8-bit CUDA weights need bitsandbytes; probe without importing it
+BITSANDBYTES_AVAILABLE = importlib.util.find_spec("bitsandbytes") is not None
+ONNXRUNTIME_AVAILABLE = (
+    importlib.util.find_spec("optimum") is not None
+    and importlib.util.find_spec("onnxruntime") is not None
+)
+OPENVINO_AVAILABLE = (
+    importlib.util.find_spec("optimum") is not None
+    and importlib.util.find_spec("openvino") is not None
+)
+
+# BART's positional embeddings stop at 1024; batches pad only to their longest input
+MAX_INPUT_TOKENS = 1024
+
+# Tokenized inputs kept per summarizer so repeated prompts skip BPE
+TOKEN_CACHE_SIZE = 256
+
+# Popularity needed before an article earns an Editor's Take
+EDITORS_TAKE_MIN_SCORE = 50
+
+# Sentence boundary: terminal punctuation followed by whitespace and a capital, so
+# "3.14" stays whole. The lookbehinds skip single-letter initials ("U.S. Senate",
+# "J. Smith") and common honorifics ("Dr. Lee").
+_SENT_SPLIT = re.compile(
+    r'(?<=[.!?])(?<!\b[A-Z]\.)(?<!\bMr\.)(?<!\bMs\.)(?<!\bDr\.)(?<!\bSt\.)(?<!\bMrs\.)\s+(?=[A-Z])'
+)
+
+# Category lookups denormalized once so formatting loops avoid nested dict access
+_CATEGORIES_FMT = {
+    k: {**v, 'title_lower': v['title'].lower()}
+    for k, v in CATEGORIES.items()
+}
+
+# "Why it matters" building blocks, combined per (category, keyword class) below
+_CATEGORY_INSIGHTS = {
+    'research': "This research could influence future AI model development and provide insights for developers building next-generation applications.",
+    'tools': "This tool development could streamline AI workflows and provide new capabilities for developers and researchers in their projects.",
+    'industry': "This industry move signals broader market trends that could impact AI funding, partnerships, and strategic decisions for founders and companies.",
+    'use-case': "This application demonstrates practical AI implementation strategies that developers can adapt for their own use cases.",
+    'misc': "This development highlights emerging trends in the AI ecosystem that could influence future technology decisions."
+}
+# Title keyword classes, checked in priority order against the lowercased title
+_TITLE_CONTEXTS = (
+    ('funding', re.compile(r'funding|investment|raises'),
+     " The funding landscape provides signals about which AI approaches investors see as most promising."),
+    ('open-source', re.compile(r'open source|open-source'),
+     " Open source developments often accelerate innovation and provide accessible alternatives for developers."),
+    ('model', re.compile(r'model|llm|ai'),
+     " Model improvements directly impact the capabilities available to AI practitioners and researchers."),
+)
+_WHY_IT_MATTERS = {
+    (category, None): insight for category, insight in _CATEGORY_INSIGHTS.items()
+}
+_WHY_IT_MATTERS.update({
+    (category, kind): insight + context
+    for category, insight in _CATEGORY_INSIGHTS.items()
+    for kind, _, context in _TITLE_CONTEXTS
+})
+
+# Intro theme patterns, checked in priority order against lowercased titles
+_INTRO_THEMES = (
+    (re.compile(r'funding|raises|investment'), "major funding rounds"),
+    (re.compile(r'model|llm|gpt'), "breakthrough model releases"),
+    (re.compile(r'tool|api|platform'), "new developer tools"),
+    (re.compile(r'research|study|paper'), "cutting-edge research"),
+)
+_SECONDARY_THEMES = (
+    (re.compile(r'partnership|acquisition|deal'), "strategic partnerships"),
+    (re.compile(r'open source|open-source'), "open source innovations"),
+    (re.compile(r'regulation|policy|government'), "policy developments"),
+)
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into at most five stripped, non-empty sentence chunks"""
+    return [s.strip() for s in _SENT_SPLIT.split(text, maxsplit=4) if s.strip()]
+
+
+# Content words for extractive scoring; the length floor drops most stopwords
+_WORD_RE = re.compile(r"[a-z][a-z'-]{3,}")
+
+
+@functools.lru_cache(maxsize=256)
+def _select_salient_passages(text: str, budget_tokens: int = 450) -> str:
+    """Pick lead sentences plus the highest term-frequency sentences that fit the token budget"""
+    # BART's BPE averages roughly 4 tokens per 3 English words
+    budget_words = budget_tokens * 3 // 4
+    if len(text.split()) <= budget_words:
+        return text
+    
+    # Fragments under five words are mostly navigation, bylines, and cookie notices
+    sentences = [
+        s.strip() for line in text.splitlines() for s in _SENT_SPLIT.split(line)
+        if len(s.split()) >= 5
+    ]
+    if not sentences:
+        return text[:2000]
+    
+    words = [_WORD_RE.findall(s.lower()) for s in sentences]
+    tf = Counter(w for sentence_words in words for w in sentence_words)
+    
+    # Lead-3 first (news puts the key facts up top), then by mean term frequency
+    ranked = list(range(min(3, len(sentences))))
+    ranked += sorted(
+        range(3, len(sentences)),
+        key=lambda i: sum(tf[w] for w in words[i]) / (len(words[i]) or 1),
+        reverse=True
+    )
+    
+    chosen, used = [], 0
+    for i in ranked:
+        length = len(sentences[i].split())
+        if used + length > budget_words:
+            continue
+        chosen.append(i)
+        used += length
+    
+    # Every sentence overran the budget (run-on or single-line scrapes), so truncate instead
+    if not chosen:
+        return ' '.join(text.split()[:budget_words])
+    
+    return ' '.join(sentences[i] for i in sorted(chosen))
+
+
+def _as_sentence(text: str) -> str:
+    """Ensure a sentence ends with terminal punctuation"""
+    return text if text.endswith(('.', '!', '?')) else f"{text}."
+
 
 class BartNewsletterSummarizer:
     """
@@ -22,11 +162,14 @@ class BartNewsletterSummarizer:
     Perfect for AI newsletter generation with editorial quality
     """
     
-    def __init__(self, model_name="facebook/bart-large-cnn"):
+    def __init__(self, model_name="sshleifer/distilbart-cnn-12-6"):
         self.model_name = model_name
         self.model = None
         self.tokenizer = None
+        self._token_cache = {}
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # When set, summaries come from a resident bart_server instead of a local model
+        self.server_url = BART_SERVER_URL.rstrip('/') or None
         logger.info(f"🤖 Initializing BART summarizer with device: {self.device}")
         
     def load_model(self):
@@ -37,18 +180,70 @@ class BartNewsletterSummarizer:
         try:
             logger.info(f"📥 Loading {self.model_name}...")
             
-            # Load tokenizer
-            self.tokenizer = BartTokenizer.from_pretrained(self.model_name)
+            # Load Rust-backed fast tokenizer
+            self.tokenizer = BartTokenizerFast.from_pretrained(self.model_name)
+            self.tokenizer.model_max_length = MAX_INPUT_TOKENS
+            
+            if BART_BACKEND == "onnx" and self.device == "cpu":
+                if ONNXRUNTIME_AVAILABLE:
+                    self.model = self._load_exported_model("onnx")
+                    logger.info("✅ BART model loaded with ONNX Runtime on cpu")
+                    return
+                logger.warning("⚠️ BART_BACKEND=onnx needs optimum. Install with: pip install optimum[onnxruntime]")
+            
+            if BART_BACKEND == "openvino" and self.device == "cpu":
+                if OPENVINO_AVAILABLE:
+                    self.model = self._load_exported_model("openvino")
+                    logger.info("✅ BART model loaded with OpenVINO on cpu")
+                    return
+                logger.warning("⚠️ BART_BACKEND=openvino needs optimum-intel. Install with: pip install optimum[openvino]")
             
             # Load model with memory optimization
-            self.model = BartForConditionalGeneration.from_pretrained(
-                self.model_name,
-                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
-                device_map="auto" if self.device == "cuda" else None
-            )
+            if self.device == "cuda":
+                # BF16 keeps FP32's exponent range, so no FP16 overflow edge cases
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            else:
+                dtype = torch.float32
+            load_kwargs = {
+                'torch_dtype': dtype,
+                'device_map': "auto" if self.device == "cuda" else None
+            }
+            
+            # "auto" quantizes only on CPU, where FP32 inference is bandwidth-bound
+            quantize = BART_QUANT == "int8" or (BART_QUANT == "auto" and self.device == "cpu")
+            if quantize and self.device == "cuda":
+                if BITSANDBYTES_AVAILABLE:
+                    from transformers import BitsAndBytesConfig
+                    load_kwargs['quantization_config'] = BitsAndBytesConfig(load_in_8bit=True)
+                else:
+                    logger.warning("⚠️ BART_QUANT=int8 needs bitsandbytes on CUDA. Install with: pip install bitsandbytes")
+                    quantize = False
+            
+            # Fused scaled-dot-product attention (FlashAttention kernels on CUDA)
+            try:
+                self.model = BartForConditionalGeneration.from_pretrained(
+                    self.model_name, attn_implementation="sdpa", **load_kwargs
+                )
+            except (ValueError, TypeError) as e:
+                logger.warning(f"⚠️ SDPA attention unavailable, using eager attention: {e}")
+                self.model = BartForConditionalGeneration.from_pretrained(self.model_name, **load_kwargs)
+            
+            self.model = self.model.eval()
             
             if self.device == "cpu":
                 self.model = self.model.to(self.device)
+                
+                # Dynamic int8 quantization of the Linear layers halves memory traffic
+                if quantize:
+                    self.model = torch.quantization.quantize_dynamic(
+                        self.model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+            
+            if quantize:
+                logger.info("🗜️ BART weights quantized to int8")
+            
+            if BART_COMPILE and self.device == "cuda" and not quantize:
+                self._compile_model()
             
             logger.info(f"✅ BART model loaded successfully on {self.device}")
             
@@ -56,149 +251,431 @@ class BartNewsletterSummarizer:
             logger.error(f"❌ Failed to load BART model: {e}")
             raise
     
+    def _load_exported_model(self, backend: str):
+        """Load the ONNX Runtime or OpenVINO export of the model, exporting once if needed"""
+        if backend == "onnx":
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM as model_cls
+            export_root, kwargs = BART_ONNX_DIR, {'provider': "CPUExecutionProvider"}
+        else:
+            from optimum.intel import OVModelForSeq2SeqLM as model_cls
+            export_root, kwargs = BART_OPENVINO_DIR, {}
+        
+        export_dir = os.path.join(export_root, self.model_name.replace('/', '--'))
+        if os.path.isdir(export_dir) and os.listdir(export_dir):
+            return model_cls.from_pretrained(export_dir, **kwargs)
+        
+        logger.info(f"📦 Exporting {self.model_name} for {backend} (one-time, cached in {export_dir})...")
+        model = model_cls.from_pretrained(self.model_name, export=True, **kwargs)
+        model.save_pretrained(export_dir)
+        return model
+    
+    def _compile_model(self):
+        """Capture the decoder step as a CUDA graph to cut per-token launch overhead"""
+        # Without a fixed-shape KV cache every decode step changes shape, so CUDA graphs
+        # would keep recompiling; stay eager instead
+        if not getattr(self.model, '_supports_static_cache', False):
+            logger.info("⏭️  Static KV cache unsupported for this model, skipping torch.compile")
+            return
+        
+        eager_forward = self.model.forward
+        cache_implementation = self.model.generation_config.cache_implementation
+        try:
+            self.model.generation_config.cache_implementation = "static"
+            self.model.forward = torch.compile(eager_forward, mode="reduce-overhead", fullgraph=False)
+            
+            # Compilation is lazy, so run a short generate to surface Inductor/Triton failures here
+            warmup_ids = self.tokenizer.encode("Warm-up input.", return_tensors="pt").to(self.device)
+            with torch.inference_mode():
+                self.model.generate(warmup_ids, max_new_tokens=4, num_beams=1, do_sample=False)
+            logger.info("⚡ BART forward compiled with torch.compile (reduce-overhead)")
+        except Exception as e:
+            self.model.forward = eager_forward
+            self.model.generation_config.cache_implementation = cache_implementation
+            logger.warning(f"⚠️ torch.compile failed, running eager: {e}")
+    
     def generate_text(self, prompt: str, max_length: int = 200, temperature: float = 0.7) -> str:
         """Generate text using BART (compatibility method for enhanced_summarizer)"""
         # For BART, we'll use the prompt as input text and summarize it
         return self.summarize_text(prompt, max_length=max_length, min_length=max_length//4)
     
-    def summarize_text(self, text: str, max_length: int = 200, min_length: int = 50) -> str:
+    def _encode(self, text: str, max_length: int) -> tuple:
+        """Tokenize text into token ids, cached per instance so repeated prompts skip BPE"""
+        key = (text, max_length)
+        ids = self._token_cache.get(key)
+        if ids is None:
+            ids = tuple(self.tokenizer.encode(text, max_length=max_length, truncation=True))
+            # Evict the oldest entry to keep the cache bounded
+            if len(self._token_cache) >= TOKEN_CACHE_SIZE:
+                self._token_cache.pop(next(iter(self._token_cache)), None)
+            self._token_cache[key] = ids
+        return ids
+    
+    def _to_device(self, tensor: torch.Tensor) -> torch.Tensor:
+        """Move a CPU tensor to the model device"""
+        # Page-locked host memory lets the H2D copy run asynchronously
+        if self.device == "cuda":
+            tensor = tensor.pin_memory()
+        return tensor.to(self.device, non_blocking=True)
+    
+    def _encode_batch(self, texts: List[str]) -> Dict[str, torch.Tensor]:
+        """Pad cached per-text encodings into one CPU batch"""
+        encoded = [torch.tensor(self._encode(text, MAX_INPUT_TOKENS)) for text in texts]
+        lengths = torch.tensor([len(ids) for ids in encoded])
+        input_ids = torch.nn.utils.rnn.pad_sequence(
+            encoded, batch_first=True, padding_value=self.tokenizer.pad_token_id
+        )
+        attention_mask = (torch.arange(input_ids.shape[1])[None, :] < lengths[:, None]).long()
+        return {'input_ids': input_ids, 'attention_mask': attention_mask}
+    
+    @staticmethod
+    def _fits_summary(text: str, max_length: int) -> bool:
+        """Check if text is already short enough to stand in for its own summary"""
+        return len(text.split()) <= max_length * 0.8
+    
+    @staticmethod
+    def _generate_kwargs(max_length: int, min_length: int, num_beams: int) -> Dict:
+        """Decoding settings sized for newsletter blurbs"""
+        kwargs = {
+            'max_new_tokens': max_length,
+            'min_length': min_length,
+            'num_beams': num_beams,
+            'do_sample': False,
+            'no_repeat_ngram_size': 3,
+            'use_cache': True,
+        }
+        # Length penalty and early stopping only apply to beam search
+        if num_beams > 1:
+            kwargs.update(length_penalty=2.0, early_stopping=True)
+        else:
+            kwargs.update(length_penalty=1.0, early_stopping=False)
+        return kwargs
+    
+    def _remote_summarize(self, texts: List[str], max_length: int, min_length: int,
+                          num_beams: int) -> Optional[List[Optional[str]]]:
+        """Summarize through the resident BART server; None means fall back to the local model"""
+        try:
+            response = requests.post(
+                f"{self.server_url}/summarize",
+                json={
+                    'model_name': self.model_name,
+                    'texts': texts,
+                    'max_length': max_length,
+                    'min_length': min_length,
+                    'num_beams': num_beams
+                },
+                timeout=300
+            )
+            response.raise_for_status()
+            return response.json()['summaries']
+        except Exception as e:
+            logger.warning(f"⚠️ BART server at {self.server_url} unavailable, using local model: {e}")
+            self.server_url = None
+            return None
+    
+    def _summary_key(self, text: str, max_length: int, min_length: int, num_beams: int) -> str:
+        """Disk cache key for a summary of text under the given decoding settings"""
+        return cache_key('summary', self.model_name, text, max_length, min_length, num_beams)
+    
+    def summarize_text(self, text: str, max_length: int = 200, min_length: int = 50, num_beams: int = 1) -> str:
         """Generate summary using BART's native summarization capabilities"""
+        key = self._summary_key(text, max_length, min_length, num_beams)
+        cached = cache_get(key)
+        if cached is not None:
+            return cached
+        
+        if self.server_url:
+            remote = self._remote_summarize([text], max_length, min_length, num_beams)
+            if remote is not None:
+                cache_set(key, remote[0])
+                return remote[0]
+        
         if self.model is None:
             self.load_model()
         
         try:
-            # Tokenize input
-            inputs = self.tokenizer.encode(
-                text, 
-                return_tensors="pt", 
-                max_length=1024, 
-                truncation=True
-            ).to(self.device)
+            # Tokenize input (cached on CPU) and move it to the model device
+            inputs = self._to_device(torch.tensor([self._encode(text, MAX_INPUT_TOKENS)]))
             
-            # Generate summary
-            with torch.no_grad():
+            # Generate summary (inference_mode also skips autograd version tracking)
+            with torch.inference_mode():
                 summary_ids = self.model.generate(
                     inputs,
-                    max_length=max_length,
-                    min_length=min_length,
-                    length_penalty=2.0,
-                    num_beams=4,
-                    early_stopping=True,
-                    do_sample=False
+                    **self._generate_kwargs(max_length, min_length, num_beams)
                 )
             
             # Decode summary
-            summary = self.tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-            return summary.strip()
+            summary = self.tokenizer.decode(summary_ids[0], skip_special_tokens=True).strip()
+            cache_set(key, summary)
+            return summary
             
         except Exception as e:
             logger.error(f"❌ BART summarization failed: {e}")
             return None
     
-    def get_editorial_summary(self, article: Dict) -> str:
-        """Generate editorial-style summary using BART's summarization + proper formatting"""
-        category = article.get('category', 'misc')
-        category_config = CATEGORIES.get(category, CATEGORIES['misc'])
+    def summarize_texts(self, texts: List[str], max_length: int = 200, min_length: int = 50,
+                        num_beams: int = 1) -> List[Optional[str]]:
+        """Summarize several texts with one padded generate call"""
+        summaries: List[Optional[str]] = [None] * len(texts)
+        
+        # Previously summarized inputs never reach the model
+        pending = []
+        keys = {}
+        for i, text in enumerate(texts):
+            keys[i] = self._summary_key(text, max_length, min_length, num_beams)
+            summaries[i] = cache_get(keys[i])
+            if summaries[i] is None:
+                pending.append(i)
+        
+        if not pending:
+            return summaries
+        
+        if self.server_url:
+            remote = self._remote_summarize([texts[i] for i in pending], max_length, min_length, num_beams)
+            if remote is not None:
+                for i, summary in zip(pending, remote):
+                    summaries[i] = summary
+                    cache_set(keys[i], summary)
+                return summaries
         
-        # Get a clean summary from BART (no prompts, just the article text)
-        article_text = article['text'][:2000]
-        base_summary = self.summarize_text(article_text, max_length=120, min_length=40)
+        if self.model is None:
+            self.load_model()
+        
+        try:
+            inputs = self._encode_batch([texts[i] for i in pending])
+            inputs = {k: self._to_device(v) for k, v in inputs.items()}
+            
+            with torch.inference_mode():
+                summary_ids = self.model.generate(
+                    **inputs,
+                    **self._generate_kwargs(max_length, min_length, num_beams)
+                )
+            
+            decoded = self.tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+            for i, summary in zip(pending, decoded):
+                summaries[i] = summary.strip()
+                cache_set(keys[i], summaries[i])
+                
+        except Exception as e:
+            logger.error(f"❌ BART batch summarization failed: {e}")
+        
+        return summaries
+    
+    def stream_summary_sentences(self, text: str, max_length: int = 200, min_length: int = 50) -> Iterator[str]:
+        """Yield summary sentences as BART decodes them so formatting overlaps generation"""
+        # Short inputs are already summary-sized
+        if self._fits_summary(text, max_length):
+            for sentence in _SENT_SPLIT.split(text):
+                if sentence.strip():
+                    yield sentence.strip()
+            return
+        
+        # Cached and remote summaries arrive whole, so split after the fact
+        key = self._summary_key(text, max_length, min_length, 1)
+        summary = cache_get(key)
+        if summary is None and self.server_url:
+            summary = self.summarize_text(text, max_length=max_length, min_length=min_length) or ''
+        if summary is not None:
+            for sentence in _SENT_SPLIT.split(summary):
+                sentence = self._clean_summary(sentence)
+                if sentence:
+                    yield sentence
+            return
+        
+        if self.model is None:
+            self.load_model()
+        
+        inputs = self._to_device(torch.tensor([self._encode(text, MAX_INPUT_TOKENS)]))
+        streamer = TextIteratorStreamer(self.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        failed = threading.Event()
         
+        def _generate():
+            try:
+                with torch.inference_mode():
+                    # Streaming only supports a single beam
+                    self.model.generate(
+                        inputs,
+                        streamer=streamer,
+                        **self._generate_kwargs(max_length, min_length, num_beams=1)
+                    )
+            except Exception as e:
+                logger.error(f"❌ BART streaming summarization failed: {e}")
+                failed.set()
+                streamer.end()
+        
+        thread = threading.Thread(target=_generate, daemon=True)
+        thread.start()
+        
+        # Split lazily as tokens arrive; a boundary only matches once the next
+        # sentence has started, so the trailing part stays buffered
+        buffer = ""
+        decoded = []
+        for chunk in streamer:
+            decoded.append(chunk)
+            buffer += chunk
+            *sentences, buffer = _SENT_SPLIT.split(buffer)
+            for sentence in sentences:
+                sentence = self._clean_summary(sentence)
+                if sentence:
+                    yield sentence
+        sentence = self._clean_summary(buffer)
+        if sentence:
+            yield sentence
+        
+        thread.join()
+        # Store the full summary where summarize_text would find it
+        if not failed.is_set():
+            cache_set(key, "".join(decoded).strip())
+    
+    def get_base_summary(self, article: Dict, num_beams: int = 1) -> Optional[str]:
+        """Summarize the article text once; shared by the summary and Editor's Take"""
+        # Get a clean summary from BART (no prompts, just the article text)
+        article_text = _select_salient_passages(article['text'])
+        # Skip the forward pass entirely when the article is summary-sized
+        if self._fits_summary(article_text, 120):
+            return article_text.strip()
+        return self._clean_summary(self.summarize_text(article_text, max_length=120, min_length=40, num_beams=num_beams))
+    
+    def get_base_summaries(self, articles: List[Dict], num_beams: int = 1) -> List[Optional[str]]:
+        """Batched get_base_summary for a list of articles"""
+        texts = [_select_salient_passages(article['text']) for article in articles]
+        summaries: List[Optional[str]] = [None] * len(texts)
+        
+        # Summary-sized articles never reach the model
+        pending = []
+        for i, text in enumerate(texts):
+            if self._fits_summary(text, 120):
+                summaries[i] = text.strip()
+            else:
+                pending.append(i)
+        
+        if pending:
+            generated = self.summarize_texts([texts[i] for i in pending], max_length=120, min_length=40, num_beams=num_beams)
+            for i, summary in zip(pending, generated):
+                summaries[i] = self._clean_summary(summary)
+        return summaries
+    
+    def get_tiered_base_summaries(self, articles: List[Dict], num_beams: int = 1) -> List[Optional[str]]:
+        """Batched base summaries, upgrading headline stories to BART_HEADLINE_MODEL when set"""
+        if not BART_HEADLINE_MODEL or BART_HEADLINE_MODEL == self.model_name:
+            return self.get_base_summaries(articles, num_beams=num_beams)
+        
+        headline = [i for i, a in enumerate(articles) if a.get('popularity_score', 0) > BART_HEADLINE_SCORE]
+        if not headline:
+            return self.get_base_summaries(articles, num_beams=num_beams)
+        
+        headline_set = set(headline)
+        regular = [i for i in range(len(articles)) if i not in headline_set]
+        
+        summaries: List[Optional[str]] = [None] * len(articles)
+        if regular:
+            for i, summary in zip(regular, self.get_base_summaries([articles[i] for i in regular], num_beams=num_beams)):
+                summaries[i] = summary
+        
+        large = get_bart_summarizer(BART_HEADLINE_MODEL)
+        for i, summary in zip(headline, large.get_base_summaries([articles[i] for i in headline], num_beams=num_beams)):
+            summaries[i] = summary
+        return summaries
+    
+    @staticmethod
+    def _clean_summary(base_summary: Optional[str]) -> Optional[str]:
+        """Remove any prompt artifacts from a BART summary"""
         if not base_summary:
             return None
+        return base_summary.replace('You are the editor', '').replace('Write like a sharp', '').strip()
+    
+    def get_editorial_summary(self, article: Dict, base_summary: Optional[str] = None) -> str:
+        """Generate editorial-style summary using BART's summarization + proper formatting"""
+        category = article.get('category', 'misc')
+        if category not in _CATEGORIES_FMT:
+            category = 'misc'
         
-        # Clean up the summary (remove any prompt artifacts)
-        base_summary = base_summary.replace('You are the editor', '').replace('Write like a sharp', '').strip()
+        if base_summary is None:
+            # Stream sentences straight from the decoder
+            sentences = self.stream_summary_sentences(_select_salient_passages(article['text']), max_length=120, min_length=40)
+        else:
+            # Split summary into sentences for bullet points
+            sentences = iter(_split_sentences(base_summary))
+        
+        rundown = next(sentences, None)
+        if rundown is None:
+            return None
         
         # Create editorial structure
         title = article['title']
         headline = title[:55] + "..." if len(title) > 55 else title
         
-        # Split summary into sentences for bullet points
-        sentences = [s.strip() for s in base_summary.split('.') if s.strip()]
-        
-        # Build the editorial format
-        summary = f"""## {category_config['emoji']} **{headline}**
-
-**The Rundown:** {sentences[0] if sentences else base_summary[:100]}.
-
-"""
-        
-        # Create bullet points from key information
-        if len(sentences) > 1:
-            for sentence in sentences[1:4]:  # Up to 3 more sentences as bullets
-                if sentence and len(sentence) > 10:  # Only meaningful sentences
-                    summary += f"• {sentence}.\n"
+        # Create bullet points from key information as sentences arrive
+        bullets = []
+        sentence_count = 1
+        for sentence in sentences:
+            sentence_count += 1
+            if sentence_count <= 4 and len(sentence) > 10:  # Up to 3 meaningful sentences as bullets
+                bullets.append(f"• {_as_sentence(sentence)}\n")
         
         # Add contextual bullet if we don't have enough
-        if len(sentences) <= 2:
-            summary += f"• Significant development in {category_config['title'].lower()}\n"
+        if sentence_count <= 2:
+            bullets.append(f"• Significant development in {_CATEGORIES_FMT[category]['title_lower']}\n")
         
         # Create a meaningful "Why it matters" based on category
-        why_matters = self._get_why_it_matters(category, article['title'])
+        why_matters = self._get_why_it_matters(category, title)
         
-        summary += f"""
+        # Build the editorial format in one pass
+        return f"""## {_CATEGORIES_FMT[category]['emoji']} **{headline}**
+
+**The Rundown:** {_as_sentence(rundown)}
+
+{''.join(bullets)}
 **Why it matters:** {why_matters}
 
 [👉 Read more]({article['url']})
 
 ---"""
-        
-        return summary
     
     def _get_why_it_matters(self, category: str, title: str) -> str:
         """Generate contextual 'why it matters' based on category and title"""
-        category_insights = {
-            'research': "This research could influence future AI model development and provide insights for developers building next-generation applications.",
-            'tools': "This tool development could streamline AI workflows and provide new capabilities for developers and researchers in their projects.",
-            'industry': "This industry move signals broader market trends that could impact AI funding, partnerships, and strategic decisions for founders and companies.",
-            'use-case': "This application demonstrates practical AI implementation strategies that developers can adapt for their own use cases.",
-            'misc': "This development highlights emerging trends in the AI ecosystem that could influence future technology decisions."
-        }
-        
-        base_insight = category_insights.get(category, category_insights['misc'])
+        if category not in _CATEGORY_INSIGHTS:
+            category = 'misc'
         
         # Add specific context based on title keywords
-        if any(word in title.lower() for word in ['funding', 'investment', 'raises']):
-            base_insight += " The funding landscape provides signals about which AI approaches investors see as most promising."
-        elif any(word in title.lower() for word in ['open source', 'open-source']):
-            base_insight += " Open source developments often accelerate innovation and provide accessible alternatives for developers."
-        elif any(word in title.lower() for word in ['model', 'llm', 'ai']):
-            base_insight += " Model improvements directly impact the capabilities available to AI practitioners and researchers."
-        
-        return base_insight
-    
-    def get_editors_take(self, article: Dict) -> Optional[str]:
-        """Generate Editor's Take using BART summarization"""
-        if article.get('popularity_score', 0) < 50:
+        title_lower = title.lower()
+        for kind, pattern, _ in _TITLE_CONTEXTS:
+            if pattern.search(title_lower):
+                return _WHY_IT_MATTERS[(category, kind)]
+        
+        return _WHY_IT_MATTERS[(category, None)]
+    
+    def get_editors_take(self, article: Dict, base_summary: Optional[str] = None) -> Optional[str]:
+        """Generate Editor's Take from the article's BART summary"""
+        if article.get('popularity_score', 0) < EDITORS_TAKE_MIN_SCORE:
             return None
         
-        # Use BART to create a concise, insightful take
-        article_text = article['text'][:1500]
-        take = self.summarize_text(
-            f"Editorial analysis: {article_text}", 
-            max_length=80, 
-            min_length=30
-        )
+        # Reuse the article summary instead of running a second generate pass
+        if base_summary is None:
+            base_summary = self.get_base_summary(article)
         
-        if take:
-            # Add editorial voice
-            take = f"Editor's Take: {take}"
+        if not base_summary:
+            return None
         
-        return take
+        # Lead with the first two sentences and add editorial voice
+        sentences = _split_sentences(base_summary)
+        take = ' '.join(_as_sentence(sentence) for sentence in sentences[:2])
+        
+        return f"Editor's Take: {take}"
     
-    def generate_newsletter_intro(self, articles: List[Dict]) -> str:
+    def generate_newsletter_intro(self, articles: List[Dict], category_counts: Optional[Dict[str, int]] = None) -> str:
         """Generate clean newsletter introduction"""
-        # Get top categories
-        categories = {}
-        for article in articles:
-            cat = article.get('category', 'misc')
-            categories[cat] = categories.get(cat, 0) + 1
+        # Get top categories, reusing counts when the caller already has them
+        categories = category_counts
+        if categories is None:
+            categories = {}
+            for article in articles:
+                cat = article.get('category', 'misc')
+                categories[cat] = categories.get(cat, 0) + 1
         
         top_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)[:3]
         
         # Create a clean, professional intro without using BART (to avoid prompt artifacts)
-        category_names = [CATEGORIES[cat]['title'] for cat, _ in top_categories]
+        category_names = [_CATEGORIES_FMT[cat]['title'] for cat, _ in top_categories]
         
         # Build intro based on the day's content
         if len(articles) >= 8:
@@ -208,83 +685,130 @@ class BartNewsletterSummarizer:
         else:
             intensity = "focused"
         
+        # Lowercase titles once and share them between both theme lookups
+        titles = [article['title'].lower() for article in articles]
+        top_titles_text = ' '.join(titles[:5])
+        all_titles_text = ' '.join(titles)
+        
         intro = f"""It's a {intensity} day in AI with {len(articles)} key developments spanning {', '.join(category_names[:2])}{',' if len(category_names) > 2 else ' and'} {category_names[-1] if len(category_names) > 2 else ''}.
 
-From {self._get_intro_theme(articles)} to {self._get_secondary_theme(articles)}, today's digest captures the moves shaping AI's trajectory. Here's what developers, founders, and researchers need to know."""
+From {self._get_intro_theme(top_titles_text)} to {self._get_secondary_theme(all_titles_text)}, today's digest captures the moves shaping AI's trajectory. Here's what developers, founders, and researchers need to know."""
         
         return intro
     
-    def _get_intro_theme(self, articles: List[Dict]) -> str:
-        """Get primary theme for intro based on articles"""
-        # Look for common themes in titles
-        titles_text = ' '.join([article['title'].lower() for article in articles[:5]])
-        
-        if any(word in titles_text for word in ['funding', 'raises', 'investment']):
-            return "major funding rounds"
-        elif any(word in titles_text for word in ['model', 'llm', 'gpt']):
-            return "breakthrough model releases"
-        elif any(word in titles_text for word in ['tool', 'api', 'platform']):
-            return "new developer tools"
-        elif any(word in titles_text for word in ['research', 'study', 'paper']):
-            return "cutting-edge research"
-        else:
-            return "industry developments"
-    
-    def _get_secondary_theme(self, articles: List[Dict]) -> str:
-        """Get secondary theme for intro"""
-        titles_text = ' '.join([article['title'].lower() for article in articles])
-        
-        if any(word in titles_text for word in ['partnership', 'acquisition', 'deal']):
-            return "strategic partnerships"
-        elif any(word in titles_text for word in ['open source', 'open-source']):
-            return "open source innovations"
-        elif any(word in titles_text for word in ['regulation', 'policy', 'government']):
-            return "policy developments"
+    def _get_intro_theme(self, titles_text: str) -> str:
+        """Get primary theme for intro from the lowercased top titles"""
+        for pattern, theme in _INTRO_THEMES:
+            if pattern.search(titles_text):
+                return theme
+        return "industry developments"
+    
+    def _get_secondary_theme(self, titles_text: str) -> str:
+        """Get secondary theme for intro from all lowercased titles"""
+        for pattern, theme in _SECONDARY_THEMES:
+            if pattern.search(titles_text):
+                return theme
+        return "technical breakthroughs"
+    
+    def _format_article(self, article: Dict, base_summary: str, style: str, with_take: bool = True) -> tuple:
+        """Format summary and editor's take from a precomputed base summary"""
+        if style == "editorial":
+            summary = self.get_editorial_summary(article, base_summary=base_summary)
         else:
-            return "technical breakthroughs"
+            summary = self.get_basic_summary(article, base_summary=base_summary)
+        
+        editors_take = None
+        if summary and with_take:
+            editors_take = self.get_editors_take(article, base_summary=base_summary)
+        return summary, editors_take
     
     def summarize_articles(self, articles: List[Dict], style: str = "editorial") -> tuple:
         """Summarize articles using BART"""
-        summaries = []
+        records, editors_takes = self.summarize_article_records(articles, style)
+        return [record['summary'] for record in records], editors_takes
+    
+    def _generation_worker(self, articles: List[Dict], num_beams: int, results: queue.Queue):
+        """Producer: run BART batch by batch and queue (article, base_summary) pairs"""
+        # Each batch is tokenized inline just before it generates: a background tokenizer
+        # would share the fast tokenizer with batch_decode across threads, and with the
+        # default two batches there is almost nothing to overlap
+        try:
+            for start in range(0, len(articles), BART_BATCH_SIZE):
+                batch = articles[start:start + BART_BATCH_SIZE]
+                logger.info(f"📝 Processing articles {start+1}-{start+len(batch)}/{len(articles)}...")
+                
+                try:
+                    # Run BART once per article and format everything from that summary
+                    base_summaries = self.get_tiered_base_summaries(batch, num_beams=num_beams)
+                except Exception as e:
+                    logger.error(f"❌ Error summarizing batch starting at article {start+1}: {e}")
+                    continue
+                
+                for article, base_summary in zip(batch, base_summaries):
+                    if base_summary:
+                        results.put((article, base_summary))
+                
+                # Optional pause for thermally constrained hosts; off by default
+                if BATCH_PACING_SEC > 0 and start + BART_BATCH_SIZE < len(articles):
+                    time.sleep(BATCH_PACING_SEC)
+        finally:
+            results.put(None)
+    
+    def summarize_article_records(self, articles: List[Dict], style: str = "editorial") -> tuple:
+        """Summarize articles, keeping each summary paired with its article and category"""
+        records = []
         editors_takes = []
         
-        # Load model once for all summaries
-        self.load_model()
+        # Editorial copy is quality-sensitive, so it gets a small beam
+        num_beams = 2 if style == "editorial" else 1
+        
+        # Decide Editor's Take eligibility once for the whole run
+        editor_candidates = {
+            id(article) for article in articles
+            if article.get('popularity_score', 0) >= EDITORS_TAKE_MIN_SCORE
+        }
+        if not editor_candidates:
+            logger.info("⏭️  No articles qualify for an Editor's Take")
+        
+        # A producer thread keeps BART busy while this thread does the string templating
+        results = queue.Queue(maxsize=2 * BART_BATCH_SIZE)
+        producer = threading.Thread(
+            target=self._generation_worker, args=(articles, num_beams, results), daemon=True
+        )
+        producer.start()
         
-        for i, article in enumerate(articles):
+        while (item := results.get()) is not None:
+            article, base_summary = item
             try:
-                logger.info(f"📝 Processing article {i+1}/{len(articles)}: {article['title'][:50]}...")
-                
-                # Generate summary
-                if style == "editorial":
-                    summary = self.get_editorial_summary(article)
-                else:
-                    summary = self.get_basic_summary(article)
-                
-                if summary:
-                    summaries.append(summary)
-                    
-                    # Generate Editor's Take for high-impact stories
-                    editors_take = self.get_editors_take(article)
-                    if editors_take:
-                        editors_takes.append({
-                            'title': article['title'],
-                            'take': editors_take
-                        })
-                
-                # Small delay to prevent overwhelming the system
-                time.sleep(0.5)
-                
+                summary, editors_take = self._format_article(
+                    article, base_summary, style, with_take=id(article) in editor_candidates
+                )
             except Exception as e:
-                logger.error(f"❌ Error summarizing article {article.get('title', 'Unknown')}: {e}")
+                logger.error(f"❌ Error formatting article {article.get('title', 'Unknown')}: {e}")
                 continue
-        
-        logger.info(f"✅ Generated {len(summaries)} summaries and {len(editors_takes)} editor's takes")
-        return summaries, editors_takes
+            
+            if summary:
+                records.append({
+                    'summary': summary,
+                    'category': article.get('category', 'misc'),
+                    'article': article
+                })
+                
+                # Editor's Take for high-impact stories
+                if editors_take:
+                    editors_takes.append({
+                        'title': article['title'],
+                        'take': editors_take
+                    })
+        
+        producer.join()
+        logger.info(f"✅ Generated {len(records)} summaries and {len(editors_takes)} editor's takes")
+        return records, editors_takes
     
-    def get_basic_summary(self, article: Dict) -> str:
+    def get_basic_summary(self, article: Dict, base_summary: Optional[str] = None) -> str:
         """Generate basic summary using BART"""
-        base_summary = self.summarize_text(article['text'][:2000], max_length=120, min_length=40)
+        if base_summary is None:
+            base_summary = self.get_base_summary(article)
         
         if not base_summary:
             return None
@@ -303,20 +827,19 @@ From {self._get_intro_theme(articles)} to {self._get_secondary_theme(articles)},
         """Generate complete newsletter content using BART"""
         logger.info("🚀 Starting BART-based newsletter generation...")
         
-        # Generate introduction
-        intro = self.generate_newsletter_intro(articles)
-        
         # Generate summaries
-        summaries, editors_takes = self.summarize_articles(articles, style)
+        records, editors_takes = self.summarize_article_records(articles, style)
         
-        # Organize by category
+        # Organize by category and count stories in the same pass
+        summaries = []
         categorized_summaries = {}
-        for i, article in enumerate(articles):
-            if i < len(summaries):
-                category = article.get('category', 'misc')
-                if category not in categorized_summaries:
-                    categorized_summaries[category] = []
-                categorized_summaries[category].append(summaries[i])
+        for record in records:
+            summaries.append(record['summary'])
+            categorized_summaries.setdefault(record['category'], []).append(record['summary'])
+        category_counts = {category: len(items) for category, items in categorized_summaries.items()}
+        
+        # Generate introduction
+        intro = self.generate_newsletter_intro(articles, category_counts=category_counts)
         
         result = {
             'intro': intro,
@@ -338,11 +861,11 @@ From {self._get_intro_theme(articles)} to {self._get_secondary_theme(articles)},
 
 
 # Global instance for reuse
-_bart_summarizer_instance = None
+_bart_summarizer_instances: Dict[str, BartNewsletterSummarizer] = {}
 
-def get_bart_summarizer():
-    """Get or create the global BART summarizer instance"""
-    global _bart_summarizer_instance
-    if _bart_summarizer_instance is None:
-        _bart_summarizer_instance = BartNewsletterSummarizer()
-    return _bart_summarizer_instance
+def get_bart_summarizer(model_name: Optional[str] = None):
+    """Get or create the global BART summarizer instance for a model"""
+    model_name = model_name or TRANSFORMER_MODEL
+    if model_name not in _bart_summarizer_instances:
+        _bart_summarizer_instances[model_name] = BartNewsletterSummarizer(model_name)
+    return _bart_summarizer_instances[model_name]
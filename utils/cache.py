@@ -0,0 +1,65 @@
+"""
+Optional on-disk cache for article extraction and BART summaries
+Backed by diskcache when installed; every helper is a no-op otherwise
+"""
+import hashlib
+import logging
+import threading
+from config import CACHE_DIR, CACHE_ENABLED
+
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Article extraction results are reused for a day
+ARTICLE_CACHE_TTL = 86400
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Get or open the shared disk cache, or None when caching is unavailable"""
+    global _cache
+    if not (CACHE_ENABLED and DISKCACHE_AVAILABLE):
+        return None
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = diskcache.Cache(CACHE_DIR)
+            logger.info(f"💾 Using disk cache at {CACHE_DIR}")
+    return _cache
+
+
+def cache_key(*parts) -> str:
+    """Build a stable key from strings and numbers"""
+    return hashlib.sha1("\x1f".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+
+
+def cache_get(key: str):
+    """Look up a cached value, None on miss"""
+    cache = get_cache()
+    if cache is None:
+        return None
+    try:
+        return cache.get(key)
+    except Exception as e:
+        logger.warning(f"⚠️ Cache read failed: {e}")
+        return None
+
+
+def cache_set(key: str, value, expire=None):
+    """Store a value; failures are logged and ignored"""
+    cache = get_cache()
+    if cache is None or value is None:
+        return
+    try:
+        cache.set(key, value, expire=expire)
+    except Exception as e:
+        logger.warning(f"⚠️ Cache write failed: {e}")
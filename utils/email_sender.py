@@ -3,109 +3,182 @@ Email sending utilities for AI Newsletter Generator
 """
 import smtplib
 import os
+import re
+import time
+import functools
+from datetime import date
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import logging
-from config import EMAIL_CONFIG
+from concurrent.futures import ThreadPoolExecutor
+from config import EMAIL_CONFIG, EMAIL_MAX_WORKERS, EMAIL_MINIFY_HTML
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def send_newsletter_email(html_file_path, subject=None, custom_config=None):
-    """Send newsletter email using HTML file"""
+REQUIRED_FIELDS = ['from_email', 'to_email', 'smtp_server', 'smtp_port', 'smtp_user', 'smtp_password']
+
+# Indentation and blank lines; browsers and mail clients render any run as one space.
+# Line breaks are kept (one per run) so no line exceeds the SMTP length limit.
+_HTML_LINE_BREAK_RE = re.compile(r'\s*\n\s*')
+_HTML_SPACES_RE = re.compile(r'[ \t]{2,}')
+
+# Attempts per message for temporary SMTP failures, with exponential backoff
+SEND_RETRIES = 3
+
+
+class SmtpSession:
+    """SMTP_SSL connection that pays for TLS and login once and sends many messages"""
     
-    # Use custom config if provided, otherwise use default
-    config = custom_config if custom_config else EMAIL_CONFIG
+    def __init__(self, config):
+        self.config = config
+        self.server = None
     
-    # Validate configuration
-    required_fields = ['from_email', 'to_email', 'smtp_server', 'smtp_port', 'smtp_user', 'smtp_password']
-    for field in required_fields:
+    def __enter__(self):
+        self._connect()
+        return self
+    
+    def _connect(self):
+        """Open the TLS connection and log in"""
+        self.server = smtplib.SMTP_SSL(self.config['smtp_server'], self.config['smtp_port'])
+        self.server.ehlo()
+        self.server.login(self.config['smtp_user'], self.config['smtp_password'])
+    
+    def send(self, msg, to_email):
+        """Send one message, retrying transient failures without re-serializing it"""
+        payload = msg.as_bytes()
+        for attempt in range(SEND_RETRIES):
+            try:
+                self.server.sendmail(self.config['from_email'], to_email, payload)
+                return
+            except smtplib.SMTPServerDisconnected:
+                if attempt == SEND_RETRIES - 1:
+                    raise
+                logger.warning(f"⚠️ SMTP connection dropped, reconnecting (attempt {attempt + 1})")
+                time.sleep(2 ** attempt)
+                self._connect()
+            except smtplib.SMTPResponseException as e:
+                # Only 4xx replies are temporary
+                if not 400 <= e.smtp_code < 500 or attempt == SEND_RETRIES - 1:
+                    raise
+                logger.warning(f"⚠️ Temporary SMTP error {e.smtp_code}, retrying (attempt {attempt + 1})")
+                time.sleep(2 ** attempt)
+    
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.server.quit()
+        except smtplib.SMTPException:
+            self.server.close()
+
+
+def _minify_html(html_content):
+    """Collapse whitespace runs to cut the bytes sent over SMTP"""
+    return _HTML_SPACES_RE.sub(' ', _HTML_LINE_BREAK_RE.sub('\n', html_content)).strip()
+
+
+@functools.lru_cache(maxsize=1)
+def _default_subject(day):
+    """Newsletter subject for a given day, formatted once per day"""
+    return f"🧠 Your AI News Digest – {day.strftime('%B %d, %Y')}"
+
+
+def _validate_config(config):
+    """Log and report any missing email settings"""
+    for field in REQUIRED_FIELDS:
         if not config.get(field):
             logger.error(f"Missing email configuration: {field}")
             return False
-    
-    # Default subject if not provided
-    if not subject:
-        from datetime import datetime
-        subject = f"🧠 Your AI News Digest – {datetime.today().strftime('%B %d, %Y')}"
-    
-    try:
-        # Read HTML content
-        with open(html_file_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
-        
-        # Create message
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = config['from_email']
-        msg["To"] = config['to_email']
-        
-        # Add HTML part
-        html_part = MIMEText(html_content, "html")
-        msg.attach(html_part)
-        
-        # Send email
-        logger.info(f"📧 Sending email to {config['to_email']}...")
-        
-        with smtplib.SMTP_SSL(config['smtp_server'], config['smtp_port']) as server:
-            server.login(config['smtp_user'], config['smtp_password'])
-            server.sendmail(config['from_email'], config['to_email'], msg.as_string())
-        
-        logger.info(f"✅ Email sent successfully to {config['to_email']}")
-        return True
-        
-    except FileNotFoundError:
-        logger.error(f"HTML file not found: {html_file_path}")
-        return False
-    except Exception as e:
-        logger.error(f"Failed to send email: {e}")
-        return False
+    return True
 
 
-def send_newsletter_content(html_content, subject=None, custom_config=None):
-    """Send newsletter email using HTML content string"""
+def _build_message(html_content, subject, from_email):
+    """Build the newsletter message once; only the To header changes per recipient"""
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = from_email
+    msg.attach(MIMEText(html_content, "html"))
+    return msg
+
+
+def _send_to_group(config, subject, html_content, recipients):
+    """Send to a group of recipients over one SMTP session, returning how many succeeded"""
+    # Each group owns its message, so worker threads never share MIME objects
+    msg = _build_message(html_content, subject, config['from_email'])
+    sent = 0
+    with SmtpSession(config) as session:
+        for to_email in recipients:
+            logger.info(f"📧 Sending email to {to_email}...")
+            del msg["To"]
+            msg["To"] = to_email
+            try:
+                session.send(msg, to_email)
+                sent += 1
+                logger.info(f"✅ Email sent successfully to {to_email}")
+            except smtplib.SMTPRecipientsRefused as e:
+                logger.error(f"Failed to send email to {to_email}: {e}")
+    return sent
+
+
+def send_newsletter_batch(html_content, recipients=None, subject=None, custom_config=None, max_workers=None):
+    """Send newsletter HTML to several recipients, spreading them over parallel SMTP sessions"""
     
     # Use custom config if provided, otherwise use default
     config = custom_config if custom_config else EMAIL_CONFIG
     
     # Validate configuration
-    required_fields = ['from_email', 'to_email', 'smtp_server', 'smtp_port', 'smtp_user', 'smtp_password']
-    for field in required_fields:
-        if not config.get(field):
-            logger.error(f"Missing email configuration: {field}")
-            return False
+    if not _validate_config(config):
+        return False
+    
+    # Default to the configured (comma-separated) recipient list
+    if recipients is None:
+        recipients = [to.strip() for to in config['to_email'].split(',') if to.strip()]
+    
+    if not recipients:
+        logger.error("No recipients to send the newsletter to")
+        return False
     
     # Default subject if not provided
     if not subject:
-        from datetime import datetime
-        subject = f"🧠 Your AI News Digest – {datetime.today().strftime('%B %d, %Y')}"
+        subject = _default_subject(date.today())
+    
+    if EMAIL_MINIFY_HTML:
+        html_content = _minify_html(html_content)
+    
+    # Each worker keeps its own connection for a slice of the recipients
+    workers = max(1, min(max_workers or EMAIL_MAX_WORKERS, len(recipients)))
+    groups = [recipients[i::workers] for i in range(workers)]
     
     try:
-        # Create message
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = config['from_email']
-        msg["To"] = config['to_email']
-        
-        # Add HTML part
-        html_part = MIMEText(html_content, "html")
-        msg.attach(html_part)
-        
-        # Send email
-        logger.info(f"📧 Sending email to {config['to_email']}...")
-        
-        with smtplib.SMTP_SSL(config['smtp_server'], config['smtp_port']) as server:
-            server.login(config['smtp_user'], config['smtp_password'])
-            server.sendmail(config['from_email'], config['to_email'], msg.as_string())
-        
-        logger.info(f"✅ Email sent successfully to {config['to_email']}")
-        return True
-        
+        if workers == 1:
+            sent = _send_to_group(config, subject, html_content, recipients)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                sent = sum(executor.map(lambda group: _send_to_group(config, subject, html_content, group), groups))
     except Exception as e:
         logger.error(f"Failed to send email: {e}")
         return False
+    
+    return sent == len(recipients)
+
+
+def send_newsletter_email(html_file_path, subject=None, custom_config=None):
+    """Send newsletter email using HTML file"""
+    try:
+        # Read HTML content
+        with open(html_file_path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+    except FileNotFoundError:
+        logger.error(f"HTML file not found: {html_file_path}")
+        return False
+    
+    return send_newsletter_content(html_content, subject, custom_config)
+
+
+def send_newsletter_content(html_content, subject=None, custom_config=None):
+    """Send newsletter email using HTML content string"""
+    return send_newsletter_batch(html_content, subject=subject, custom_config=custom_config)
 
 
 def test_email_config(custom_config=None):
@@ -114,8 +187,7 @@ def test_email_config(custom_config=None):
     config = custom_config if custom_config else EMAIL_CONFIG
     
     # Check if all required fields are present
-    required_fields = ['from_email', 'to_email', 'smtp_server', 'smtp_port', 'smtp_user', 'smtp_password']
-    missing_fields = [field for field in required_fields if not config.get(field)]
+    missing_fields = [field for field in REQUIRED_FIELDS if not config.get(field)]
     
     if missing_fields:
         logger.error(f"Missing email configuration fields: {', '.join(missing_fields)}")
@@ -2,30 +2,140 @@
 Enhanced content fetching utilities with multiple sources, popularity scoring, and categorization
 """
 import feedparser
-from newspaper import Article
+from newspaper import Article, Config
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import heapq
+import importlib.util
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlsplit, parse_qsl, urlencode
 import re
+from .cache import ARTICLE_CACHE_TTL, cache_key, cache_get, cache_set
 from config import (
     RSS_FEEDS, API_SOURCES, ARTICLES_PER_FEED, DELAY_BETWEEN_REQUESTS, 
-    AI_KEYWORDS, HIGH_IMPACT_KEYWORDS, CATEGORIES, MIN_ARTICLE_LENGTH,
-    MAX_ARTICLE_AGE_HOURS, MAX_ARTICLES_PER_CATEGORY
+    AI_KEYWORDS, HIGH_IMPACT_KEYWORDS, CATEGORIES, MIN_ARTICLE_LENGTH, MAX_ARTICLE_BYTES,
+    MAX_ARTICLE_AGE_HOURS, MAX_ARTICLES_PER_CATEGORY, FETCH_MAX_WORKERS, TITLE_PREFILTER_CATEGORIES
 )
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional fast extraction path (httpx download + trafilatura parse)
+try:
+    import httpx
+    import trafilatura
+    FAST_EXTRACT_AVAILABLE = True
+except ImportError:
+    FAST_EXTRACT_AVAILABLE = False
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Optional linear-time multi-pattern matcher for keyword scans
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Every keyword the fetcher looks for (AI, high-impact, category), lowercased once
+_AI_KEYWORD_SET = frozenset(k.lower() for k in AI_KEYWORDS)
+_HIGH_IMPACT_LOWER = [k.lower() for k in HIGH_IMPACT_KEYWORDS]
+_AI_LOWER = [k.lower() for k in AI_KEYWORDS]
+_AI_KEYWORDS_DISTINCT = tuple(_AI_KEYWORD_SET)
+_KEYWORDS_LOWER = tuple(
+    _AI_KEYWORD_SET | set(_HIGH_IMPACT_LOWER)
+    | {k.lower() for config in CATEGORIES.values() for k in config['keywords']}
+)
+
+# Whole-word AI keywords (optionally plural) for the title gate, so "ai" doesn't match "said"
+_AI_TITLE_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(k) for k in sorted(_AI_KEYWORD_SET, key=len, reverse=True)) + r")s?\b"
+)
+
+# Aho-Corasick reports every (including overlapping) keyword hit in one pass;
+# without it, plain substring checks beat a combined regex in CPython's re
+_KEYWORD_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _KEYWORDS_LOWER:
+        _KEYWORD_AUTOMATON.add_word(_keyword, _keyword)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+# Category config lowercased once: keyword -> categories listing it, and per-category sources
+_KEYWORD_CATEGORIES = {}
+for _category, _config in CATEGORIES.items():
+    for _keyword in _config['keywords']:
+        _KEYWORD_CATEGORIES.setdefault(_keyword.lower(), []).append(_category)
+_CATEGORY_SOURCES = {
+    category: tuple(source.lower() for source in config['sources']) for category, config in CATEGORIES.items()
+}
+
+# Query parameters that only track the click and never change the page
+_TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref'})
+
+CREDIBLE_SOURCES = frozenset({
+    'arxiv.org', 'openai.com', 'anthropic.com', 'ai.googleblog.com',
+    'techcrunch.com', 'venturebeat.com', 'technologyreview.com'
+})
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _parse_publish_date(value):
+    """Normalize an ISO string or datetime to a naive datetime, or None if it can't be read"""
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    # Anything that isn't an ISO-looking string is rejected without raising
+    if not isinstance(value, str) or not value[:4].isdigit():
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _read_capped(chunks):
+    """Join downloaded chunks, stopping once MAX_ARTICLE_BYTES have been read"""
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= MAX_ARTICLE_BYTES:
+            break
+    return bytes(buffer[:MAX_ARTICLE_BYTES])
+
+
+def _canonicalize_url(url):
+    """Scheme-, case-, and tracking-parameter-insensitive key for a URL"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not (name.lower().startswith('utm_') or name.lower() in _TRACKING_PARAMS)
+    ])
+    return f"{host}{parts.path.rstrip('/')}?{query}" if query else f"{host}{parts.path.rstrip('/')}"
+
+
+def _find_keywords(text_lower):
+    """Set of all keywords occurring in lowercased text"""
+    if _KEYWORD_AUTOMATON is not None:
+        return {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text_lower)}
+    return {keyword for keyword in _KEYWORDS_LOWER if keyword in text_lower}
+
 
 class ArticleScorer:
     """Calculate popularity scores for articles"""
     
     @staticmethod
-    def calculate_popularity_score(article):
-        """Calculate multi-factor popularity score"""
+    def calculate_popularity_score(article, found_keywords=None):
+        """Calculate multi-factor popularity score (reusing keyword hits when the caller has them)"""
         score = 0
         
         # Engagement signals (when available)
@@ -34,28 +144,28 @@ class ArticleScorer:
         score += article.get('shares', 0) * 0.25
         
         # Keyword importance weighting
-        text_content = (article.get('title', '') + ' ' + article.get('text', '')).lower()
+        found = found_keywords
+        if found is None:
+            found = _find_keywords((article.get('title', '') + ' ' + article.get('text', '')).lower())
         
         # High-impact keywords get significant boost
-        for keyword in HIGH_IMPACT_KEYWORDS:
-            if keyword.lower() in text_content:
+        for keyword in _HIGH_IMPACT_LOWER:
+            if keyword in found:
                 score += 15
         
         # AI keywords get moderate boost
-        for keyword in AI_KEYWORDS:
-            if keyword.lower() in text_content:
+        for keyword in _AI_LOWER:
+            if keyword in found:
                 score += 5
         
         # Recency bonus (24-48 hours)
         if article.get('publish_date'):
-            try:
-                if isinstance(article['publish_date'], str):
-                    # Try to parse string date
-                    pub_date = datetime.fromisoformat(article['publish_date'].replace('Z', '+00:00'))
-                else:
-                    pub_date = article['publish_date']
-                
-                hours_old = (datetime.now() - pub_date.replace(tzinfo=None)).total_seconds() / 3600
+            pub_date = _parse_publish_date(article['publish_date'])
+            if pub_date is None:
+                # If date parsing fails, give small penalty
+                score -= 5
+            else:
+                hours_old = (datetime.now() - pub_date).total_seconds() / 3600
                 
                 if hours_old <= 24:
                     score += 25
@@ -63,18 +173,10 @@ class ArticleScorer:
                     score += 15
                 elif hours_old <= 72:
                     score += 5
-            except:
-                # If date parsing fails, give small penalty
-                score -= 5
-        
-        # Source credibility bonus
-        source_domain = urlparse(article.get('url', '')).netloc.lower()
-        credible_sources = [
-            'arxiv.org', 'openai.com', 'anthropic.com', 'ai.googleblog.com',
-            'techcrunch.com', 'venturebeat.com', 'technologyreview.com'
-        ]
         
-        if any(domain in source_domain for domain in credible_sources):
+        # Source credibility bonus (the host or any parent domain is credible)
+        labels = (urlparse(article.get('url', '')).hostname or '').split('.')
+        if any('.'.join(labels[i:]) in CREDIBLE_SOURCES for i in range(len(labels) - 1)):
             score += 10
         
         # Length bonus (longer articles often more substantial)
@@ -91,31 +193,30 @@ class ArticleCategorizer:
     """Categorize articles into research, tools, industry, etc."""
     
     @staticmethod
-    def categorize_article(article):
+    def categorize_article(article, found_keywords=None):
         """Determine article category based on content and source"""
-        title = article.get('title', '').lower()
-        text = article.get('text', '').lower()
-        url = article.get('url', '').lower()
-        
-        content = f"{title} {text}"
-        
+        found = found_keywords
+        if found is None:
+            # Find every category keyword in one scan of the content
+            found = _find_keywords(f"{article.get('title', '')} {article.get('text', '')}".lower())
+        return ArticleCategorizer._score_categories(found, article.get('url', '').lower())
+    
+    @staticmethod
+    def _score_categories(found, url):
+        """Pick the best category from keyword hits and a lowercased URL"""
         # Score each category
-        category_scores = {}
+        category_scores = dict.fromkeys(CATEGORIES, 0)
         
-        for category, config in CATEGORIES.items():
-            score = 0
-            
-            # Keyword matching
-            for keyword in config['keywords']:
-                if keyword.lower() in content:
-                    score += 10
-            
-            # Source matching
-            for source in config['sources']:
-                if source.lower() in url:
-                    score += 20
-            
-            category_scores[category] = score
+        # Keyword matching: each hit credits the categories that list it
+        for keyword in found:
+            for category in _KEYWORD_CATEGORIES.get(keyword, ()):
+                category_scores[category] += 10
+        
+        # Source matching
+        for category, sources in _CATEGORY_SOURCES.items():
+            for source in sources:
+                if source in url:
+                    category_scores[category] += 20
         
         # Return category with highest score, default to 'misc'
         if max(category_scores.values()) > 0:
@@ -130,36 +231,143 @@ class EnhancedContentFetcher:
     def __init__(self):
         self.scorer = ArticleScorer()
         self.categorizer = ArticleCategorizer()
+        self._host_locks = {}
+        self._host_last_request = {}
+        self._host_locks_guard = threading.Lock()
+        self._http_client = None
+        
+        # Keep-alive connections shared by feed and Hacker News requests across worker threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Only the top image URL is used, so newspaper doesn't need to fetch images to score them
+        self.newspaper_config = Config()
+        self.newspaper_config.fetch_images = False
+        self._http_client_lock = threading.Lock()
+    
+    def _get_http_client(self):
+        """Shared connection-pooled httpx client for the fast extraction path"""
+        with self._http_client_lock:
+            if self._http_client is None:
+                self._http_client = httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=10,
+                    follow_redirects=True,
+                    headers={'User-Agent': 'Mozilla/5.0 (compatible; AI-Newsletter/1.0)'}
+                )
+            return self._http_client
+    
+    def _wait_for_host(self, url):
+        """Space out requests to the same host by DELAY_BETWEEN_REQUESTS"""
+        host = urlparse(url).netloc
+        with self._host_locks_guard:
+            lock = self._host_locks.setdefault(host, threading.Lock())
+        
+        with lock:
+            wait = self._host_last_request.get(host, 0) + DELAY_BETWEEN_REQUESTS - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._host_last_request[host] = time.monotonic()
     
     def is_ai_related(self, text):
         """Enhanced AI content detection"""
         text_lower = text.lower()
         
-        # Must contain at least 2 AI keywords for better precision
-        ai_keyword_count = sum(1 for keyword in AI_KEYWORDS if keyword.lower() in text_lower)
-        return ai_keyword_count >= 2
+        # Must contain at least 2 distinct AI keywords for better precision
+        if _KEYWORD_AUTOMATON is None:
+            found = 0
+            for keyword in _AI_KEYWORDS_DISTINCT:
+                if keyword in text_lower:
+                    found += 1
+                    if found >= 2:
+                        return True
+            return False
+        
+        found = set()
+        for _, keyword in _KEYWORD_AUTOMATON.iter(text_lower):
+            if keyword in _AI_KEYWORD_SET:
+                found.add(keyword)
+                if len(found) >= 2:
+                    return True
+        return False
+    
+    def mentions_ai(self, text):
+        """Cheap check for at least one whole-word AI keyword (used on titles before downloading)"""
+        return _AI_TITLE_RE.search(text.lower()) is not None
     
     def is_recent_article(self, publish_date):
         """Check if article is within acceptable age range"""
         if not publish_date:
             return True  # Include if no date available
         
+        pub_date = _parse_publish_date(publish_date)
+        if pub_date is None:
+            return True  # Include if date parsing fails
+        
+        hours_old = (datetime.now() - pub_date).total_seconds() / 3600
+        return hours_old <= MAX_ARTICLE_AGE_HOURS
+    
+    def _extract_with_trafilatura(self, url):
+        """Fetch with httpx and extract with trafilatura; None lets the caller fall back"""
         try:
-            if isinstance(publish_date, str):
-                pub_date = datetime.fromisoformat(publish_date.replace('Z', '+00:00'))
-            else:
-                pub_date = publish_date
+            # Stream so an oversized page can't stall the worker; trafilatura detects the encoding
+            with self._get_http_client().stream('GET', url) as response:
+                response.raise_for_status()
+                html = _read_capped(response.iter_bytes())
             
-            hours_old = (datetime.now() - pub_date.replace(tzinfo=None)).total_seconds() / 3600
-            return hours_old <= MAX_ARTICLE_AGE_HOURS
-        except:
-            return True  # Include if date parsing fails
+            text = trafilatura.extract(html, url=url)
+            if not text or len(text) < MIN_ARTICLE_LENGTH:
+                return None
+            
+            metadata = trafilatura.extract_metadata(html, default_url=url)
+            publish_date = None
+            if metadata and metadata.date:
+                try:
+                    publish_date = datetime.fromisoformat(metadata.date)
+                except ValueError:
+                    publish_date = None
+            
+            return {
+                'text': text,
+                'image_url': (metadata.image if metadata else None) or "",
+                'authors': [a.strip() for a in metadata.author.split(';')] if metadata and metadata.author else [],
+                'publish_date': publish_date,
+                'meta_description': (metadata.description if metadata else None) or '',
+                'meta_keywords': (metadata.tags if metadata else None) or []
+            }
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Fast extraction failed for {url}, falling back to newspaper: {e}")
+            return None
     
     def extract_article_content(self, url):
         """Enhanced article content extraction with better error handling"""
+        key = cache_key('article', url)
+        content = cache_get(key)
+        if content is None:
+            self._wait_for_host(url)
+            content = self._extract_article_content(url)
+            cache_set(key, content, expire=ARTICLE_CACHE_TTL)
+        return content
+    
+    def _extract_article_content(self, url):
+        """Download and parse an article, preferring the fast extraction path"""
+        if FAST_EXTRACT_AVAILABLE:
+            content = self._extract_with_trafilatura(url)
+            if content:
+                return content
+        
         try:
-            article = Article(url)
-            article.download()
+            # Download through the pooled session with a size cap, then let newspaper parse it
+            with self.session.get(url, stream=True, timeout=(3, 10),
+                                  headers={'User-Agent': self.newspaper_config.browser_user_agent}) as response:
+                response.raise_for_status()
+                html = _read_capped(response.iter_content(65536))
+            
+            article = Article(url, config=self.newspaper_config)
+            article.set_html(html)
             article.parse()
             
             # Skip if article is too short
@@ -179,45 +387,90 @@ class EnhancedContentFetcher:
             logger.error(f"❌ Failed to extract content from {url}: {e}")
             return None
     
+    def fetch_feed(self, category, feed_url):
+        """Download and parse one RSS feed into raw article dicts"""
+        logger.info(f"  Processing: {feed_url}")
+        
+        # Fetch the bytes ourselves so a slow feed can't stall the run (feedparser has no timeout)
+        self._wait_for_host(feed_url)
+        response = self.session.get(feed_url, timeout=(3, 10))
+        response.raise_for_status()
+        # Only titles, links, dates, and a tag-stripped summary are used, so skip feedparser's HTML sanitizer
+        feed = feedparser.parse(
+            response.content,
+            # feedparser only reads lowercase header names (e.g. the content-type charset)
+            response_headers={name.lower(): value for name, value in response.headers.items()},
+            sanitize_html=False,
+            resolve_relative_uris=False
+        )
+        
+        articles = []
+        for entry in feed.entries[:ARTICLES_PER_FEED]:
+            # Extract basic info; entries missing a title or link are skipped, not fatal to the feed
+            title = entry.get('title')
+            url = entry.get('link')
+            if not title or not url:
+                continue
+            
+            # feedparser aliases <description> to summary
+            rss_summary = entry.get('summary') or entry.get('description', '')
+            
+            # Atom feeds often only carry <updated>
+            published = entry.get('published_parsed') or entry.get('updated_parsed')
+            
+            articles.append({
+                'title': _HTML_TAG_RE.sub('', title).strip(),
+                'url': url,
+                'source_category': category,
+                'source_feed': feed_url,
+                'rss_summary': _HTML_TAG_RE.sub(' ', rss_summary).strip(),
+                'publish_date': datetime(*published[:6]) if published else None
+            })
+        
+        return articles
+    
     def fetch_rss_articles(self):
         """Fetch articles from categorized RSS feeds"""
         logger.info("🔍 Fetching articles from RSS feeds...")
         articles = []
         
-        for category, feeds in RSS_FEEDS.items():
-            logger.info(f"📡 Fetching {category} articles...")
+        feeds = [(category, feed_url) for category, urls in RSS_FEEDS.items() for feed_url in urls]
+        if not feeds:
+            return articles
+        
+        # Feeds live on different hosts, so fetch them concurrently (same-host pacing still applies)
+        with ThreadPoolExecutor(max_workers=min(FETCH_MAX_WORKERS, len(feeds))) as executor:
+            futures = [executor.submit(self.fetch_feed, category, feed_url) for category, feed_url in feeds]
             
-            for feed_url in feeds:
+            # Collect in feed order so the article list stays deterministic
+            for (category, feed_url), future in zip(feeds, futures):
                 try:
-                    logger.info(f"  Processing: {feed_url}")
-                    feed = feedparser.parse(feed_url)
-                    
-                    for entry in feed.entries[:ARTICLES_PER_FEED]:
-                        # Extract basic info
-                        article_data = {
-                            'title': entry.title,
-                            'url': entry.link,
-                            'source_category': category,
-                            'source_feed': feed_url,
-                            'publish_date': getattr(entry, 'published_parsed', None)
-                        }
-                        
-                        # Convert publish_date if available
-                        if article_data['publish_date']:
-                            article_data['publish_date'] = datetime(*article_data['publish_date'][:6])
-                        
-                        articles.append(article_data)
-                        
+                    articles.extend(future.result())
                 except Exception as e:
                     logger.error(f"Failed to fetch from {feed_url}: {e}")
-                    continue
-                
-                # Rate limiting
-                time.sleep(DELAY_BETWEEN_REQUESTS)
         
         logger.info(f"✅ Fetched {len(articles)} articles from RSS feeds")
         return articles
     
+    def fetch_hackernews_story(self, story_id):
+        """Fetch one Hacker News item, returning raw article data if it is AI-related"""
+        story_response = self.session.get(f"{API_SOURCES['hackernews']}/item/{story_id}.json", timeout=(3, 10))
+        story = story_response.json()
+        
+        if story and story.get('title') and story.get('url'):
+            # Check if AI-related
+            if self.is_ai_related(story['title']):
+                return {
+                    'title': story['title'],
+                    'url': story['url'],
+                    'source_category': 'misc',
+                    'source_feed': 'hackernews',
+                    'upvotes': story.get('score', 0),
+                    'comments': story.get('descendants', 0),
+                    'publish_date': datetime.fromtimestamp(story.get('time', 0))
+                }
+        return None
+    
     def fetch_hackernews_articles(self):
         """Fetch AI-related articles from Hacker News"""
         logger.info("🔥 Fetching from Hacker News...")
@@ -225,33 +478,21 @@ class EnhancedContentFetcher:
         
         try:
             # Get top stories
-            response = requests.get(f"{API_SOURCES['hackernews']}/topstories.json")
-            story_ids = response.json()[:50]  # Top 50 stories
+            response = self.session.get(f"{API_SOURCES['hackernews']}/topstories.json", timeout=(3, 10))
+            story_ids = response.json()[:20]  # Process the top 20 stories
             
-            for story_id in story_ids[:20]:  # Process first 20
-                try:
-                    story_response = requests.get(f"{API_SOURCES['hackernews']}/item/{story_id}.json")
-                    story = story_response.json()
-                    
-                    if story and story.get('title') and story.get('url'):
-                        # Check if AI-related
-                        if self.is_ai_related(story['title']):
-                            article_data = {
-                                'title': story['title'],
-                                'url': story['url'],
-                                'source_category': 'misc',
-                                'source_feed': 'hackernews',
-                                'upvotes': story.get('score', 0),
-                                'comments': story.get('descendants', 0),
-                                'publish_date': datetime.fromtimestamp(story.get('time', 0))
-                            }
+            # The HN API is a CDN-backed JSON store, so items are fetched concurrently
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = [executor.submit(self.fetch_hackernews_story, story_id) for story_id in story_ids]
+                
+                # Collect in ranking order
+                for story_id, future in zip(story_ids, futures):
+                    try:
+                        article_data = future.result()
+                        if article_data:
                             articles.append(article_data)
-                    
-                    time.sleep(0.1)  # Rate limiting
-                    
-                except Exception as e:
-                    logger.error(f"Error fetching HN story {story_id}: {e}")
-                    continue
+                    except Exception as e:
+                        logger.error(f"Error fetching HN story {story_id}: {e}")
                     
         except Exception as e:
             logger.error(f"Error fetching from Hacker News: {e}")
@@ -259,60 +500,100 @@ class EnhancedContentFetcher:
         logger.info(f"✅ Fetched {len(articles)} articles from Hacker News")
         return articles
     
+    def process_article(self, article_data):
+        """Extract, filter, score, and categorize a single raw article"""
+        logger.info(f"🔗 Processing: {article_data['title']}")
+        
+        # Skip if not recent enough
+        if not self.is_recent_article(article_data.get('publish_date')):
+            logger.info("⏭️  Skipping - too old")
+            return None
+        
+        # Cheap gate on the feed's own title/summary before paying for the download
+        rss_summary = article_data.get('rss_summary')
+        if rss_summary and not self.is_ai_related(f"{article_data['title']} {rss_summary}"):
+            logger.info("⏭️  Skipping - RSS summary not AI-related")
+            return None
+        
+        # Without a summary, general-interest feeds must at least mention AI in the title
+        if (not rss_summary and article_data.get('source_category') in TITLE_PREFILTER_CATEGORIES
+                and not self.mentions_ai(article_data['title'])):
+            logger.info("⏭️  Skipping - title not AI-related")
+            return None
+        
+        # Extract full content (cache misses are rate limited per host, not globally)
+        content = self.extract_article_content(article_data['url'])
+        if not content:
+            return None
+        
+        # Merge data
+        full_article = {**article_data, **content}
+        
+        # Normalize the publish date once so scoring only has to subtract
+        pub_date = _parse_publish_date(full_article.get('publish_date'))
+        if pub_date is not None:
+            full_article['publish_date'] = pub_date  # Unparseable dates are left for scoring to penalize
+        
+        # Lowercase and scan the full text once; the AI check, scoring, and categorization share the hits
+        found = _find_keywords(f"{full_article['title']} {full_article['text']}".lower())
+        
+        # Check if AI-related (enhanced check: at least 2 distinct AI keywords)
+        if len(found & _AI_KEYWORD_SET) < 2:
+            logger.info("⏭️  Skipping - not AI-related")
+            return None
+        
+        # Calculate popularity score
+        full_article['popularity_score'] = self.scorer.calculate_popularity_score(full_article, found)
+        
+        # Categorize article
+        full_article['category'] = self.categorizer.categorize_article(full_article, found)
+        
+        logger.info(f"✅ Added article (score: {full_article['popularity_score']}, category: {full_article['category']})")
+        return full_article
+    
     def process_articles(self, raw_articles):
         """Process raw articles: extract content, score, and categorize"""
         logger.info("🔄 Processing articles...")
-        processed_articles = []
+        results = [None] * len(raw_articles)
         
-        for article_data in raw_articles:
-            try:
-                logger.info(f"🔗 Processing: {article_data['title']}")
-                
-                # Skip if not recent enough
-                if not self.is_recent_article(article_data.get('publish_date')):
-                    logger.info("⏭️  Skipping - too old")
-                    continue
-                
-                # Extract full content
-                content = self.extract_article_content(article_data['url'])
-                if not content:
-                    continue
-                
-                # Merge data
-                full_article = {**article_data, **content}
-                
-                # Check if AI-related (enhanced check)
-                full_text = f"{full_article['title']} {full_article['text']}"
-                if not self.is_ai_related(full_text):
-                    logger.info("⏭️  Skipping - not AI-related")
-                    continue
-                
-                # Calculate popularity score
-                full_article['popularity_score'] = self.scorer.calculate_popularity_score(full_article)
-                
-                # Categorize article
-                full_article['category'] = self.categorizer.categorize_article(full_article)
-                
-                processed_articles.append(full_article)
-                logger.info(f"✅ Added article (score: {full_article['popularity_score']}, category: {full_article['category']})")
-                
-                # Rate limiting
-                time.sleep(DELAY_BETWEEN_REQUESTS)
-                
-            except Exception as e:
-                logger.error(f"Error processing article {article_data.get('title', 'Unknown')}: {e}")
-                continue
+        # Articles come from many hosts, so download them concurrently
+        with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.process_article, article_data): i
+                for i, article_data in enumerate(raw_articles)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing article {raw_articles[i].get('title', 'Unknown')}: {e}")
+        
+        # Keep source order so ties in curation stay deterministic
+        processed_articles = [article for article in results if article]
         
         logger.info(f"🎯 Processed {len(processed_articles)} AI-related articles")
         return processed_articles
     
+    def dedupe_articles(self, articles):
+        """Drop repeat URLs, folding extra fields (e.g. HN upvotes) into the first copy"""
+        unique = {}
+        for article in articles:
+            key = _canonicalize_url(article['url'])
+            if key in unique:
+                for field, value in article.items():
+                    unique[key].setdefault(field, value)
+            else:
+                unique[key] = article
+        
+        if len(unique) < len(articles):
+            logger.info(f"🧹 Removed {len(articles) - len(unique)} duplicate URLs")
+        return list(unique.values())
+    
     def curate_top_articles(self, articles):
         """Curate top articles by category and overall score"""
         logger.info("🎨 Curating top articles...")
         
-        # Sort by popularity score
-        articles.sort(key=lambda x: x['popularity_score'], reverse=True)
-        
         # Group by category
         categorized = {}
         for article in articles:
@@ -321,10 +602,12 @@ class EnhancedContentFetcher:
                 categorized[category] = []
             categorized[category].append(article)
         
-        # Select top articles per category
+        # Select top articles per category (a bounded heap, no need to sort everything)
         curated_articles = []
         for category, category_articles in categorized.items():
-            top_articles = category_articles[:MAX_ARTICLES_PER_CATEGORY]
+            top_articles = heapq.nlargest(
+                MAX_ARTICLES_PER_CATEGORY, category_articles, key=lambda x: x['popularity_score']
+            )
             curated_articles.extend(top_articles)
             logger.info(f"📊 {category}: {len(top_articles)} articles selected")
         
@@ -349,6 +632,9 @@ class EnhancedContentFetcher:
         hn_articles = self.fetch_hackernews_articles()
         all_articles.extend(hn_articles)
         
+        # The same story often arrives from several feeds and HN; download each URL once
+        all_articles = self.dedupe_articles(all_articles)
+        
         # Process all articles
         processed_articles = self.process_articles(all_articles)
         
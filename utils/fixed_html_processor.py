@@ -3,6 +3,7 @@ Fixed HTML processor that builds HTML programmatically to avoid template renderi
 """
 import os
 import logging
+import tempfile
 from datetime import datetime
 from config import OUTPUT_DIR, CATEGORIES
 
@@ -10,6 +11,9 @@ from config import OUTPUT_DIR, CATEGORIES
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Order in which category sections appear in the newsletter
+SECTION_ORDER = ('research', 'tools', 'industry', 'use-case', 'misc')
+
 
 class FixedHTMLProcessor:
     """Build HTML newsletter programmatically to avoid template rendering issues"""
@@ -361,18 +365,20 @@ class FixedHTMLProcessor:
         if article.get('image_url'):
             image_html = f'<img src="{article["image_url"]}" alt="{article["title"]}" class="article-image" />'
         
-        # Clean up the summary (remove markdown formatting for display)
-        summary = article.get('summary', '').replace('**', '').replace('*', '')
+        # Clean up the summary (remove markdown bold/italic markers in one pass)
+        summary = article.get('summary', '').replace('*', '')
         
         # Extract just the text content, not the full markdown
-        summary_lines = summary.split('\n')
         clean_summary = []
-        for line in summary_lines:
+        for line in summary.split('\n'):
             line = line.strip()
-            if line and not line.startswith('#') and not line.startswith('['):
+            if line and not line.startswith(('#', '[')):
                 clean_summary.append(line)
+                # Only the first 3 meaningful lines are shown
+                if len(clean_summary) == 3:
+                    break
         
-        summary_text = ' '.join(clean_summary[:3])  # First 3 meaningful lines
+        summary_text = ' '.join(clean_summary)
         if len(summary_text) > 300:
             summary_text = summary_text[:300] + "..."
         
@@ -405,34 +411,35 @@ class FixedHTMLProcessor:
         category_config = CATEGORIES.get(category, CATEGORIES['misc'])
         
         # Build section header
-        section_html = f"""
+        parts = [f"""
         <div class="section-header">
             <h2 class="section-title">{category_config['emoji']} {category_config['title']}</h2>
         </div>
         <div class="articles-container">
-        """
+        """]
         
         # Add all articles for this section
         for article in articles:
-            section_html += self.build_article_card(article, category)
+            parts.append(self.build_article_card(article, category))
         
-        section_html += "</div>"
+        parts.append("</div>")
         
-        return section_html
+        return "".join(parts)
     
     def build_editors_takes_html(self, editors_takes):
         """Build HTML for editor's takes section"""
         if not editors_takes:
             return ""
         
-        takes_html = ""
+        takes = []
         for take in editors_takes:
-            takes_html += f"""
+            takes.append(f"""
             <div class="editors-take-item">
                 <div class="editors-take-article-title">{take.get('title', '')}</div>
                 <div class="editors-take-text">{take.get('take', '')}</div>
             </div>
-            """
+            """)
+        takes_html = "".join(takes)
         
         return f"""
         <section class="editors-take-section">
@@ -447,6 +454,34 @@ class FixedHTMLProcessor:
         
         current_date = datetime.now().strftime("%B %d, %Y")
         
+        html_content = self.render_html(content, current_date)
+        
+        # Save to file, skipping the write when the page on disk is already identical
+        output_path = os.path.join(self.output_dir, "newsletter_fixed.html")
+        data = html_content.encode('utf-8')
+        if os.path.exists(output_path):
+            with open(output_path, 'rb') as f:
+                if f.read() == data:
+                    logger.info(f"✅ Fixed HTML newsletter unchanged: {output_path}")
+                    return output_path
+        
+        # Write a uniquely named temporary file and swap it in so readers never see a
+        # partial page and concurrent runs never share a temp file
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(output_path), delete=False) as f:
+            f.write(data)
+        try:
+            # NamedTemporaryFile is owner-only; keep the usual permissions for the page
+            os.chmod(f.name, 0o644)
+            os.replace(f.name, output_path)
+        except OSError:
+            os.unlink(f.name)
+            raise
+        
+        logger.info(f"✅ Fixed HTML newsletter saved to: {output_path}")
+        return output_path
+    
+    def render_html(self, content, current_date):
+        """Build the complete newsletter HTML document"""
         # Get articles and summaries
         articles = content.get('articles', [])
         summaries = content.get('summaries', [])
@@ -455,6 +490,11 @@ class FixedHTMLProcessor:
         editors_takes = content.get('editors_takes', [])
         categorized = self.categorize_articles_by_content(articles, summaries, editors_takes)
         
+        # Build every section's fragment, then join them once
+        sections_html = "\n        ".join(
+            self.build_section_html(category, categorized.get(category, [])) for category in SECTION_ORDER
+        )
+        
         # Build HTML document
         html_content = f"""<!DOCTYPE html>
 <html lang="en">
@@ -479,11 +519,7 @@ class FixedHTMLProcessor:
         </section>
         
         <!-- Content Sections -->
-        {self.build_section_html('research', categorized.get('research', []))}
-        {self.build_section_html('tools', categorized.get('tools', []))}
-        {self.build_section_html('industry', categorized.get('industry', []))}
-        {self.build_section_html('use-case', categorized.get('use-case', []))}
-        {self.build_section_html('misc', categorized.get('misc', []))}
+        {sections_html}
         
         <!-- Footer -->
         <footer class="newsletter-footer">
@@ -501,13 +537,7 @@ class FixedHTMLProcessor:
 </body>
 </html>"""
         
-        # Save to file
-        output_path = os.path.join(self.output_dir, "newsletter_fixed.html")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"✅ Fixed HTML newsletter saved to: {output_path}")
-        return output_path
+        return html_content
     
     def save_all_formats(self, content):
         """Save newsletter in multiple formats with expected file keys"""
@@ -8,13 +8,30 @@ import logging
 import os
 from urllib.parse import urlparse, urljoin
 import re
-from bs4 import BeautifulSoup
 import time
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns used on every article, compiled once
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+_FILENAME_SEPARATOR_RE = re.compile(r'[-\s]+')
+_ARXIV_ID_RE = re.compile(r'arxiv\.org/abs/(\d+\.\d+)')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+# URL hints used to score every candidate image on a page
+LOGO_INDICATORS = (
+    'logo', 'icon', 'favicon', 'brand', 'header', 'nav',
+    'avatar', 'profile', 'thumb', 'badge', 'button'
+)
+LOGO_PATHS = ('/img/logo', '/images/logo', '/assets/logo', '/static/logo')
+ARTICLE_IMAGE_INDICATORS = (
+    'article', 'post', 'content', 'story', 'news',
+    'featured', 'hero', 'main', 'cover'
+)
+TECH_IMAGE_TERMS = ('ai', 'tech', 'robot', 'computer', 'data', 'digital')
+
 
 class ImageFetcher:
     """Fetch and process images for newsletter articles"""
@@ -41,8 +58,8 @@ class ImageFetcher:
         """Generate safe filename from URL and title"""
         # Use title if available, otherwise use URL path
         if title:
-            base_name = re.sub(r'[^\w\s-]', '', title.strip())
-            base_name = re.sub(r'[-\s]+', '-', base_name)[:50]
+            base_name = _UNSAFE_FILENAME_RE.sub('', title.strip())
+            base_name = _FILENAME_SEPARATOR_RE.sub('-', base_name)[:50]
         else:
             parsed = urlparse(url)
             base_name = os.path.basename(parsed.path) or "image"
@@ -55,19 +72,12 @@ class ImageFetcher:
         """Check if an image is likely a logo or icon"""
         url_lower = image_url.lower()
         
-        # Common logo/icon indicators in URL
-        logo_indicators = [
-            'logo', 'icon', 'favicon', 'brand', 'header', 'nav',
-            'avatar', 'profile', 'thumb', 'badge', 'button'
-        ]
-        
         # Check URL for logo indicators
-        if any(indicator in url_lower for indicator in logo_indicators):
+        if any(indicator in url_lower for indicator in LOGO_INDICATORS):
             return True
         
         # Check file path for logo directories
-        logo_paths = ['/img/logo', '/images/logo', '/assets/logo', '/static/logo']
-        if any(path in url_lower for path in logo_paths):
+        if any(path in url_lower for path in LOGO_PATHS):
             return True
         
         # Check for very small images (likely icons)
@@ -94,12 +104,7 @@ class ImageFetcher:
             score -= 50
         
         # Positive scoring for article-relevant images
-        article_indicators = [
-            'article', 'post', 'content', 'story', 'news',
-            'featured', 'hero', 'main', 'cover'
-        ]
-        
-        if any(indicator in url_lower for indicator in article_indicators):
+        if any(indicator in url_lower for indicator in ARTICLE_IMAGE_INDICATORS):
             score += 20
         
         # Size scoring
@@ -116,8 +121,7 @@ class ImageFetcher:
         if context:
             context_lower = context.lower()
             # Look for AI/tech related terms in image URL
-            tech_terms = ['ai', 'tech', 'robot', 'computer', 'data', 'digital']
-            if any(term in url_lower for term in tech_terms):
+            if any(term in url_lower for term in TECH_IMAGE_TERMS):
                 score += 10
         
         return score
@@ -131,6 +135,8 @@ class ImageFetcher:
             response = requests.get(url, headers=headers, timeout=10)
             response.raise_for_status()
             
+            # Imported here so runs that never scrape images skip loading bs4
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.content, 'html.parser')
             candidate_images = []
             
@@ -202,7 +208,7 @@ class ImageFetcher:
             
             if 'arxiv.org' in url:
                 # Extract arXiv ID from URL
-                arxiv_match = re.search(r'arxiv\.org/abs/(\d+\.\d+)', url)
+                arxiv_match = _ARXIV_ID_RE.search(url)
                 if arxiv_match:
                     arxiv_id = arxiv_match.group(1)
                     # Return a placeholder for now - in production you'd extract from PDF
@@ -219,7 +225,7 @@ class ImageFetcher:
         try:
             # This is a simplified version - in production you'd use proper DDG API
             # For now, return a generated placeholder based on query
-            safe_query = re.sub(r'[^\w\s]', '', query)[:30]
+            safe_query = _NON_WORD_RE.sub('', query)[:30]
             placeholder_url = f"https://via.placeholder.com/600x300/9aa0a6/ffffff?text={safe_query.replace(' ', '+')}"
             return placeholder_url
             